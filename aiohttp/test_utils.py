@@ -513,8 +513,7 @@ def teardown_test_loop(loop: asyncio.AbstractEventLoop, fast: bool = False) -> N
     """Teardown and cleanup an event_loop created by setup_test_loop."""
     closed = loop.is_closed()
     if not closed:
-        loop.call_soon(loop.stop)
-        loop.run_forever()
+        loop.run_until_complete(loop.shutdown_asyncgens())
         loop.close()
 
     if not fast:
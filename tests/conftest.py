@@ -1,5 +1,6 @@
 # type: ignore
 import asyncio
+import gc
 import os
 import socket
 import ssl
@@ -40,6 +41,17 @@ IS_UNIX = hasattr(socket, "AF_UNIX")
 needs_unix = pytest.mark.skipif(not IS_UNIX, reason="requires UNIX sockets")
 
 
+@pytest.fixture(autouse=True, scope="session")
+def freeze_baseline_heap() -> None:
+    # Objects alive when the session starts (imported modules, pytest
+    # machinery) never become garbage during the run; freeze them so the
+    # per-test gc.collect() in teardown_test_loop has less heap to scan.
+    gc.freeze()
+    yield
+    gc.unfreeze()
+    gc.collect()
+
+
 @pytest.fixture
 def tls_certificate_authority() -> Any:
     if not TRUSTME:
@@ -20,7 +20,6 @@ import aiohttp
 from aiohttp import Fingerprint, ServerFingerprintMismatch, hdrs, web
 from aiohttp.abc import AbstractResolver
 from aiohttp.client_exceptions import TooManyRedirects
-from aiohttp.test_utils import unused_port
 
 
 @pytest.fixture
@@ -2760,7 +2759,7 @@ async def test_server_close_keepalive_connection() -> None:
         def connection_lost(self, exc):
             self.transp = None
 
-    server = await loop.create_server(Proto, "127.0.0.1", unused_port())
+    server = await loop.create_server(Proto, "127.0.0.1", 0)
 
     addr = server.sockets[0].getsockname()
 
@@ -2797,7 +2796,7 @@ async def test_handle_keepalive_on_closed_connection() -> None:
         def connection_lost(self, exc):
             self.transp = None
 
-    server = await loop.create_server(Proto, "127.0.0.1", unused_port())
+    server = await loop.create_server(Proto, "127.0.0.1", 0)
 
     addr = server.sockets[0].getsockname()
 
@@ -1617,7 +1617,7 @@ async def test_connect_with_limit_cancelled(loop: Any) -> None:
 
 
 async def test_connect_with_capacity_release_waiters(loop: Any) -> None:
-    def check_with_exc(err):
+    async def check_with_exc(err):
         conn = aiohttp.BaseConnector(limit=1)
         conn._create_connection = mock.Mock()
         conn._create_connection.return_value = loop.create_future()
@@ -1625,13 +1625,15 @@ async def test_connect_with_capacity_release_waiters(loop: Any) -> None:
 
         with pytest.raises(Exception):
             req = mock.Mock()
-            yield from conn.connect(req, None, ClientTimeout())
+            await conn.connect(req, None, ClientTimeout())
 
         assert not conn._waiters
 
-    check_with_exc(OSError(1, "permission error"))
-    check_with_exc(RuntimeError())
-    check_with_exc(asyncio.TimeoutError())
+        await conn.close()
+
+    await check_with_exc(OSError(1, "permission error"))
+    await check_with_exc(RuntimeError())
+    await check_with_exc(asyncio.TimeoutError())
 
 
 async def test_connect_with_limit_concurrent(loop: Any) -> None:
@@ -2024,8 +2026,7 @@ async def test_tcp_connector_raise_connector_ssl_error(
 
     srv = await aiohttp_server(app, ssl=ssl_ctx)
 
-    port = unused_port()
-    conn = aiohttp.TCPConnector(local_addr=("127.0.0.1", port))
+    conn = aiohttp.TCPConnector(local_addr=("127.0.0.1", 0))
 
     session = aiohttp.ClientSession(connector=conn)
     url = srv.make_url("/")
@@ -2050,8 +2051,7 @@ async def test_tcp_connector_do_not_raise_connector_ssl_error(
     app.router.add_get("/", handler)
 
     srv = await aiohttp_server(app, ssl=ssl_ctx)
-    port = unused_port()
-    conn = aiohttp.TCPConnector(local_addr=("127.0.0.1", port))
+    conn = aiohttp.TCPConnector(local_addr=("127.0.0.1", 0))
 
     session = aiohttp.ClientSession(connector=conn)
     url = srv.make_url("/")
@@ -110,7 +110,7 @@ test2: data\r
     assert len(messages) == 1
     msg = messages[0][0]
 
-    assert list(msg.headers.items()) == [("test", "line continue"), ("test2", "data")]
+    assert msg.headers == CIMultiDict([("test", "line continue"), ("test2", "data")])
     assert msg.raw_headers == ((b"test", b"line continue"), (b"test2", b"data"))
     assert not msg.should_close
     assert msg.compression is None
@@ -174,7 +174,7 @@ def test_headers_multi_feed(parser: Any) -> None:
     assert len(messages) == 1
 
     msg = messages[0][0]
-    assert list(msg.headers.items()) == [("test", "line continue")]
+    assert msg.headers == CIMultiDict([("test", "line continue")])
     assert msg.raw_headers == ((b"test", b"line continue"),)
     assert not msg.should_close
     assert msg.compression is None
@@ -195,7 +195,7 @@ def test_headers_split_field(parser: Any) -> None:
     assert len(messages) == 1
 
     msg = messages[0][0]
-    assert list(msg.headers.items()) == [("test", "value")]
+    assert msg.headers == CIMultiDict([("test", "value")])
     assert msg.raw_headers == ((b"test", b"value"),)
     assert not msg.should_close
     assert msg.compression is None
@@ -213,10 +213,9 @@ def test_parse_headers_multi(parser: Any) -> None:
     assert len(messages) == 1
     msg = messages[0][0]
 
-    assert list(msg.headers.items()) == [
-        ("Set-Cookie", "c1=cookie1"),
-        ("Set-Cookie", "c2=cookie2"),
-    ]
+    assert msg.headers == CIMultiDict(
+        [("Set-Cookie", "c1=cookie1"), ("Set-Cookie", "c2=cookie2")]
+    )
     assert msg.raw_headers == (
         (b"Set-Cookie", b"c1=cookie1"),
         (b"Set-Cookie", b"c2=cookie2"),
@@ -515,7 +514,7 @@ def test_http_request_parser(parser: Any) -> None:
     assert msg.method == "GET"
     assert msg.path == "/path"
     assert msg.version == (1, 1)
-    assert msg.headers == CIMultiDict()
+    assert not msg.headers
     assert msg.raw_headers == ()
     assert not msg.should_close
     assert msg.compression is None
@@ -622,7 +621,7 @@ def test_http_request_max_status_line_under_limit(parser: Any) -> None:
     assert msg.method == "GET"
     assert msg.path == "/path" + path.decode()
     assert msg.version == (1, 1)
-    assert msg.headers == CIMultiDict()
+    assert not msg.headers
     assert msg.raw_headers == ()
     assert not msg.should_close
     assert msg.compression is None
@@ -1,6 +1,7 @@
 # type: ignore
 # Tests for aiohttp/http_writer.py
 import array
+import zlib
 from typing import Any
 from unittest import mock
 
@@ -10,22 +11,57 @@ from multidict import CIMultiDict
 from aiohttp import http
 from aiohttp.test_utils import make_mocked_coro
 
+# deflate of b"data", pinned so tests don't re-run zlib to get
+# the reference payload
+COMPRESSED = b"x\x9cKI,I\x04\x00\x04\x00\x01\x9b"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def compressed() -> bytes:
+    # check the pinned literal against zlib once per session
+    assert COMPRESSED == zlib.compress(b"data")
+    return COMPRESSED
+
+
+class TransportStub:
+    """The minimal transport surface StreamWriter touches.
+
+    Much cheaper than a mock.Mock: every write is recorded both as a
+    separate chunk and in the flat capture buffer.
+    """
+
+    __slots__ = ("buf", "writes", "closing")
+
+    def __init__(self, buf: bytearray) -> None:
+        self.buf = buf
+        self.writes = []
+        self.closing = False
+
+    def write(self, chunk: bytes) -> None:
+        self.writes.append(chunk)
+        self.buf.extend(chunk)
+
+    def is_closing(self) -> bool:
+        return self.closing
+
+
+@pytest.fixture(scope="module")
 def buf():
     return bytearray()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def transport(buf: Any):
-    transport = mock.Mock()
+    return TransportStub(buf)
 
-    def write(chunk):
-        buf.extend(chunk)
 
-    transport.write.side_effect = write
-    transport.is_closing.return_value = False
-    return transport
+@pytest.fixture(autouse=True)
+def reset_transport(buf: Any, transport: Any):
+    # the transport stub is shared across the module; empty it out
+    # before each test
+    buf.clear()
+    transport.writes.clear()
+    transport.closing = False
 
 
 @pytest.fixture
@@ -35,150 +71,135 @@ def protocol(loop: Any, transport: Any):
     return protocol
 
 
+@pytest.fixture
+def writer(protocol: Any, loop: Any):
+    return http.StreamWriter(protocol, loop)
+
+
 def test_payloadwriter_properties(transport: Any, protocol: Any, loop: Any) -> None:
     writer = http.StreamWriter(protocol, loop)
     assert writer.protocol == protocol
     assert writer.transport == transport
 
 
-async def test_write_payload_eof(transport: Any, protocol: Any, loop: Any) -> None:
-    write = transport.write = mock.Mock()
-    msg = http.StreamWriter(protocol, loop)
-
-    await msg.write(b"data1")
-    await msg.write(b"data2")
-    await msg.write_eof()
+async def test_write_payload_eof(
+    buf: Any, transport: Any, protocol: Any, loop: Any, writer: Any
+) -> None:
+    await writer.write(b"data1")
+    await writer.write(b"data2")
+    await writer.write_eof()
 
-    content = b"".join([c[1][0] for c in list(write.mock_calls)])
-    assert b"data1data2" == content.split(b"\r\n\r\n", 1)[-1]
+    content = bytes(buf)
+    assert content.endswith(b"data1data2")
 
 
 async def test_write_payload_chunked(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
-    await msg.write(b"data")
-    await msg.write_eof()
+    writer.enable_chunking()
+    await writer.write(b"data")
+    await writer.write_eof()
 
     assert b"4\r\ndata\r\n0\r\n\r\n" == buf
 
 
 async def test_write_payload_chunked_multiple(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
-    await msg.write(b"data1")
-    await msg.write(b"data2")
-    await msg.write_eof()
+    writer.enable_chunking()
+    await writer.write(b"data1")
+    await writer.write(b"data2")
+    await writer.write_eof()
 
     assert b"5\r\ndata1\r\n5\r\ndata2\r\n0\r\n\r\n" == buf
 
 
-async def test_write_payload_length(protocol: Any, transport: Any, loop: Any) -> None:
-    write = transport.write = mock.Mock()
-
-    msg = http.StreamWriter(protocol, loop)
-    msg.length = 2
-    await msg.write(b"d")
-    await msg.write(b"ata")
-    await msg.write_eof()
+async def test_write_payload_length(
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
+) -> None:
+    writer.length = 2
+    await writer.write(b"d")
+    await writer.write(b"ata")
+    await writer.write_eof()
 
-    content = b"".join([c[1][0] for c in list(write.mock_calls)])
-    assert b"da" == content.split(b"\r\n\r\n", 1)[-1]
+    content = bytes(buf)
+    assert content.endswith(b"da")
 
 
 async def test_write_payload_chunked_filter(
-    protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    write = transport.write = mock.Mock()
-
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
-    await msg.write(b"da")
-    await msg.write(b"ta")
-    await msg.write_eof()
+    writer.enable_chunking()
+    await writer.write(b"da")
+    await writer.write(b"ta")
+    await writer.write_eof()
 
-    content = b"".join([c[1][0] for c in list(write.mock_calls)])
+    content = bytes(buf)
     assert content.endswith(b"2\r\nda\r\n2\r\nta\r\n0\r\n\r\n")
 
 
 async def test_write_payload_chunked_filter_mutiple_chunks(
-    protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    write = transport.write = mock.Mock()
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
-    await msg.write(b"da")
-    await msg.write(b"ta")
-    await msg.write(b"1d")
-    await msg.write(b"at")
-    await msg.write(b"a2")
-    await msg.write_eof()
-    content = b"".join([c[1][0] for c in list(write.mock_calls)])
+    writer.enable_chunking()
+    w = writer.write
+    for chunk in (b"da", b"ta", b"1d", b"at", b"a2"):
+        await w(chunk)
+    await writer.write_eof()
+    content = bytes(buf)
     assert content.endswith(
         b"2\r\nda\r\n2\r\nta\r\n2\r\n1d\r\n2\r\nat\r\n" b"2\r\na2\r\n0\r\n\r\n"
     )
 
 
 async def test_write_payload_deflate_compression(
-    protocol: Any, transport: Any, loop: Any
+    compressed: bytes, buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
+    writer.enable_compression("deflate")
+    await writer.write(b"data")
+    await writer.write_eof()
 
-    COMPRESSED = b"x\x9cKI,I\x04\x00\x04\x00\x01\x9b"
-    write = transport.write = mock.Mock()
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_compression("deflate")
-    await msg.write(b"data")
-    await msg.write_eof()
-
-    chunks = [c[1][0] for c in list(write.mock_calls)]
-    assert all(chunks)
-    content = b"".join(chunks)
-    assert COMPRESSED == content.split(b"\r\n\r\n", 1)[-1]
+    assert all(transport.writes)
+    assert bytes(buf).endswith(compressed)
 
 
 async def test_write_payload_deflate_and_chunked(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    compressed: bytes, buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_compression("deflate")
-    msg.enable_chunking()
+    writer.enable_compression("deflate")
+    writer.enable_chunking()
 
-    await msg.write(b"da")
-    await msg.write(b"ta")
-    await msg.write_eof()
+    await writer.write(b"da")
+    await writer.write(b"ta")
+    await writer.write_eof()
 
-    thing = b"2\r\nx\x9c\r\n" b"a\r\nKI,I\x04\x00\x04\x00\x01\x9b\r\n" b"0\r\n\r\n"
+    # the 2-byte zlib header is flushed as its own chunk, the deflated
+    # payload follows on eof
+    thing = b"2\r\n" + compressed[:2] + b"\r\na\r\n" + compressed[2:] + b"\r\n0\r\n\r\n"
     assert thing == buf
 
 
 async def test_write_payload_bytes_memoryview(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-
-    msg = http.StreamWriter(protocol, loop)
-
     mv = memoryview(b"abcd")
 
-    await msg.write(mv)
-    await msg.write_eof()
+    await writer.write(mv)
+    await writer.write_eof()
 
     thing = b"abcd"
     assert thing == buf
 
 
 async def test_write_payload_short_ints_memoryview(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
+    writer.enable_chunking()
 
     payload = memoryview(array.array("H", [65, 66, 67]))
 
-    await msg.write(payload)
-    await msg.write_eof()
+    await writer.write(payload)
+    await writer.write_eof()
 
     endians = (
         (b"6\r\n" b"\x00A\x00B\x00C\r\n" b"0\r\n\r\n"),
@@ -188,46 +209,45 @@ async def test_write_payload_short_ints_memoryview(
 
 
 async def test_write_payload_2d_shape_memoryview(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.enable_chunking()
+    writer.enable_chunking()
 
     mv = memoryview(b"ABCDEF")
     payload = mv.cast("c", [3, 2])
 
-    await msg.write(payload)
-    await msg.write_eof()
+    await writer.write(payload)
+    await writer.write_eof()
 
     thing = b"6\r\n" b"ABCDEF\r\n" b"0\r\n\r\n"
     assert thing == buf
 
 
 async def test_write_payload_slicing_long_memoryview(
-    buf: Any, protocol: Any, transport: Any, loop: Any
+    buf: Any, protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.length = 4
+    writer.length = 4
 
     mv = memoryview(b"ABCDEF")
     payload = mv.cast("c", [3, 2])
 
-    await msg.write(payload)
-    await msg.write_eof()
+    await writer.write(payload)
+    await writer.write_eof()
 
     thing = b"ABCD"
     assert thing == buf
 
 
-async def test_write_drain(protocol: Any, transport: Any, loop: Any) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg.drain = make_mocked_coro()
-    await msg.write(b"1" * (64 * 1024 * 2), drain=False)
-    assert not msg.drain.called
+async def test_write_drain(
+    protocol: Any, transport: Any, loop: Any, writer: Any
+) -> None:
+    writer.drain = make_mocked_coro()
+    await writer.write(b"1" * (64 * 1024 * 2), drain=False)
+    assert not writer.drain.called
 
-    await msg.write(b"1", drain=True)
-    assert msg.drain.called
-    assert msg.buffer_size == 0
+    await writer.write(b"1", drain=True)
+    assert writer.drain.called
+    assert writer.buffer_size == 0
 
 
 async def test_write_calls_callback(protocol: Any, transport: Any, loop: Any) -> None:
@@ -251,38 +271,36 @@ async def test_write_eof_calls_callback(
 
 
 async def test_write_to_closing_transport(
-    protocol: Any, transport: Any, loop: Any
+    protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
 
-    await msg.write(b"Before closing")
-    transport.is_closing.return_value = True
+    await writer.write(b"Before closing")
+    transport.closing = True
 
     with pytest.raises(ConnectionResetError):
-        await msg.write(b"After closing")
+        await writer.write(b"After closing")
 
 
-async def test_drain(protocol: Any, transport: Any, loop: Any) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    await msg.drain()
+async def test_drain(protocol: Any, transport: Any, loop: Any, writer: Any) -> None:
+    await writer.drain()
     assert protocol._drain_helper.called
 
 
-async def test_drain_no_transport(protocol: Any, transport: Any, loop: Any) -> None:
-    msg = http.StreamWriter(protocol, loop)
-    msg._protocol.transport = None
-    await msg.drain()
+async def test_drain_no_transport(
+    protocol: Any, transport: Any, loop: Any, writer: Any
+) -> None:
+    writer._protocol.transport = None
+    await writer.drain()
     assert not protocol._drain_helper.called
 
 
 async def test_write_headers_prevents_injection(
-    protocol: Any, transport: Any, loop: Any
+    protocol: Any, transport: Any, loop: Any, writer: Any
 ) -> None:
-    msg = http.StreamWriter(protocol, loop)
     status_line = "HTTP/1.1 200 OK"
     wrong_headers = CIMultiDict({"Set-Cookie: abc=123\r\nContent-Length": "256"})
     with pytest.raises(ValueError):
-        await msg.write_headers(status_line, wrong_headers)
+        await writer.write_headers(status_line, wrong_headers)
     wrong_headers = CIMultiDict({"Content-Length": "256\r\nSet-Cookie: abc=123"})
     with pytest.raises(ValueError):
-        await msg.write_headers(status_line, wrong_headers)
+        await writer.write_headers(status_line, wrong_headers)
@@ -1,5 +1,5 @@
 # type: ignore
-import gzip
+import asyncio
 from socket import socket
 from typing import Any
 from unittest import mock
@@ -20,9 +20,12 @@ from aiohttp.test_utils import (
     make_mocked_request,
 )
 
+# keep tests sharing the module-scoped server on one pytest-xdist worker
+# when running with -n auto --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("aiohttp_test_utils")
+
 _hello_world_str = "Hello, world"
 _hello_world_bytes = _hello_world_str.encode("utf-8")
-_hello_world_gz = gzip.compress(_hello_world_bytes)
 
 
 def _create_example_app():
@@ -55,18 +58,18 @@ def _create_example_app():
 
 
 # these exist to test the pytest scenario
-@pytest.fixture
+@pytest.fixture(scope="module")
 def loop() -> None:
     with loop_context() as loop:
         yield loop
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
     return _create_example_app()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client(loop: Any, app: Any) -> None:
     async def make_client():
         return _TestClient(_TestServer(app))
@@ -78,10 +81,17 @@ def test_client(loop: Any, app: Any) -> None:
     loop.run_until_complete(client.close())
 
 
-async def test_aiohttp_client_close_is_idempotent() -> None:
+@pytest.fixture(autouse=True)
+def reset_test_client(request: Any) -> None:
+    # the client and its server are shared across the module; drop
+    # accumulated cookies so tests stay isolated
+    if "test_client" in request.fixturenames:
+        request.getfixturevalue("test_client").session.cookie_jar.clear()
+
+
+async def test_aiohttp_client_close_is_idempotent(app: Any) -> None:
     # a test client, called multiple times, should
     # not attempt to close the server again.
-    app = _create_example_app()
     client = _TestClient(_TestServer(app))
     await client.close()
     await client.close()
@@ -151,14 +161,17 @@ async def test_client_cookie(loop: Any, test_client: Any) -> None:
     assert cookies[0].value == "val"
 
 
-@pytest.mark.parametrize(
-    "method", ["get", "post", "options", "post", "put", "patch", "delete"]
-)
-async def test_test_client_methods(method: Any, loop: Any, test_client: Any) -> None:
-    resp = await getattr(test_client, method)("/")
-    assert resp.status == 200
-    text = await resp.text()
-    assert _hello_world_str == text
+async def test_test_client_methods(loop: Any, test_client: Any) -> None:
+    methods = ("get", "post", "options", "put", "patch", "delete")
+    # one loop run for the whole matrix: issue every method concurrently
+    # against the shared client
+    resps = await asyncio.gather(
+        *(getattr(test_client, method)("/") for method in methods)
+    )
+    for resp in resps:
+        assert resp.status == 200
+        text = await resp.text()
+        assert _hello_world_str == text
 
 
 async def test_test_client_head(loop: Any, test_client: Any) -> None:
@@ -166,7 +179,10 @@ async def test_test_client_head(loop: Any, test_client: Any) -> None:
     assert resp.status == 200
 
 
-@pytest.mark.parametrize("headers", [{"token": "x"}, CIMultiDict({"token": "x"}), {}])
+_MOCKED_REQUEST_HEADERS = ({"token": "x"}, CIMultiDict({"token": "x"}), {})
+
+
+@pytest.mark.parametrize("headers", _MOCKED_REQUEST_HEADERS)
 def test_make_mocked_request(headers: Any) -> None:
     req = make_mocked_request("GET", "/", headers=headers)
     assert req.method == "GET"
@@ -220,8 +236,7 @@ def test_make_mocked_request_transport() -> None:
     assert req.transport is transport
 
 
-async def test_test_client_props() -> None:
-    app = _create_example_app()
+async def test_test_client_props(app: Any) -> None:
     server = _TestServer(app, scheme="http", host="127.0.0.1")
     client = _TestClient(server)
     assert client.scheme == "http"
@@ -250,8 +265,7 @@ async def test_test_client_raw_server_props() -> None:
     assert client.port is None
 
 
-async def test_test_server_context_manager(loop: Any) -> None:
-    app = _create_example_app()
+async def test_test_server_context_manager(app: Any, loop: Any) -> None:
     async with _TestServer(app) as server:
         client = aiohttp.ClientSession()
         resp = await client.head(server.make_url("/"))
@@ -269,8 +283,7 @@ def test_client_unsupported_arg() -> None:
     )
 
 
-async def test_server_make_url_yarl_compatibility(loop: Any) -> None:
-    app = _create_example_app()
+async def test_server_make_url_yarl_compatibility(app: Any, loop: Any) -> None:
     async with _TestServer(app) as server:
         make_url = server.make_url
         assert make_url(URL("/foo")) == make_url("/foo")
@@ -453,9 +453,12 @@ def test_single_forwarded_header_long_quoted_string() -> None:
 
 
 def test_multiple_forwarded_headers() -> None:
-    headers = CIMultiDict()
-    headers.add("Forwarded", "By=identifier1;for=identifier2, BY=identifier3")
-    headers.add("Forwarded", "By=identifier4;fOr=identifier5")
+    headers = CIMultiDict(
+        [
+            ("Forwarded", "By=identifier1;for=identifier2, BY=identifier3"),
+            ("Forwarded", "By=identifier4;fOr=identifier5"),
+        ]
+    )
     req = make_mocked_request("GET", "/", headers=headers)
     assert len(req.forwarded) == 3
     assert req.forwarded[0]["by"] == "identifier1"
@@ -466,11 +469,14 @@ def test_multiple_forwarded_headers() -> None:
 
 
 def test_multiple_forwarded_headers_bad_syntax() -> None:
-    headers = CIMultiDict()
-    headers.add("Forwarded", "for=_1;by=_2")
-    headers.add("Forwarded", "invalid value")
-    headers.add("Forwarded", "")
-    headers.add("Forwarded", "for=_3;by=_4")
+    headers = CIMultiDict(
+        [
+            ("Forwarded", "for=_1;by=_2"),
+            ("Forwarded", "invalid value"),
+            ("Forwarded", ""),
+            ("Forwarded", "for=_3;by=_4"),
+        ]
+    )
     req = make_mocked_request("GET", "/", headers=headers)
     assert len(req.forwarded) == 4
     assert req.forwarded[0]["for"] == "_1"
@@ -480,11 +486,15 @@ def test_multiple_forwarded_headers_bad_syntax() -> None:
 
 
 def test_multiple_forwarded_headers_injection() -> None:
-    headers = CIMultiDict()
-    # This could be sent by an attacker, hoping to "shadow" the second header.
-    headers.add("Forwarded", 'for=_injected;by="')
-    # This is added by our trusted reverse proxy.
-    headers.add("Forwarded", "for=_real;by=_actual_proxy")
+    headers = CIMultiDict(
+        [
+            # This could be sent by an attacker, hoping to "shadow" the
+            # second header.
+            ("Forwarded", 'for=_injected;by="'),
+            # This is added by our trusted reverse proxy.
+            ("Forwarded", "for=_real;by=_actual_proxy"),
+        ]
+    )
     req = make_mocked_request("GET", "/", headers=headers)
     assert len(req.forwarded) == 2
     assert "by" not in req.forwarded[0]
@@ -738,28 +738,25 @@ def test___repr___not_prepared() -> None:
     assert "<StreamResponse 301 not prepared>" == repr(resp)
 
 
-async def test_keep_alive_http10_default() -> None:
-    req = make_request("GET", "/", version=HttpVersion10)
-    resp = StreamResponse()
-    await resp.prepare(req)
-    assert not resp.keep_alive
-
-
-async def test_keep_alive_http10_switched_on() -> None:
-    headers = CIMultiDict(Connection="keep-alive")
-    req = make_request("GET", "/", version=HttpVersion10, headers=headers)
-    req._message = req._message._replace(should_close=False)
-    resp = StreamResponse()
-    await resp.prepare(req)
-    assert resp.keep_alive
-
-
-async def test_keep_alive_http09() -> None:
-    headers = CIMultiDict(Connection="keep-alive")
-    req = make_request("GET", "/", version=HttpVersion(0, 9), headers=headers)
+@pytest.mark.parametrize(
+    ("version", "keep_alive_header", "keep_alive_message", "expected"),
+    [
+        (HttpVersion10, False, False, False),
+        (HttpVersion10, True, True, True),
+        (HttpVersion(0, 9), True, False, False),
+    ],
+    ids=["http10_default", "http10_switched_on", "http09"],
+)
+async def test_keep_alive(
+    version, keep_alive_header, keep_alive_message, expected
+) -> None:
+    headers = CIMultiDict(Connection="keep-alive") if keep_alive_header else None
+    req = make_request("GET", "/", version=version, headers=headers)
+    if keep_alive_message:
+        req._message = req._message._replace(should_close=False)
     resp = StreamResponse()
     await resp.prepare(req)
-    assert not resp.keep_alive
+    assert resp.keep_alive == expected
 
 
 async def test_prepare_twice() -> None:
@@ -799,15 +796,16 @@ def test_response_ctor() -> None:
 
 async def test_ctor_with_headers_and_status() -> None:
     resp = Response(body=b"body", status=201, headers={"Age": "12", "DATE": "date"})
+    headers = resp.headers
 
     assert 201 == resp.status
     assert b"body" == resp.body
-    assert resp.headers["AGE"] == "12"
+    assert headers["AGE"] == "12"
 
     req = make_mocked_request("GET", "/")
     await resp._start(req)
     assert 4 == resp.content_length
-    assert resp.headers["CONTENT-LENGTH"] == "4"
+    assert headers["CONTENT-LENGTH"] == "4"
 
 
 def test_ctor_content_type() -> None:
@@ -826,19 +824,20 @@ def test_ctor_text_body_combined() -> None:
 
 async def test_ctor_text() -> None:
     resp = Response(text="test text")
+    headers = resp.headers
 
     assert 200 == resp.status
     assert "OK" == resp.reason
     assert 9 == resp.content_length
-    assert CIMultiDict([("CONTENT-TYPE", "text/plain; charset=utf-8")]) == resp.headers
+    assert CIMultiDict([("CONTENT-TYPE", "text/plain; charset=utf-8")]) == headers
 
     assert resp.body == b"test text"
     assert resp.text == "test text"
 
-    resp.headers["DATE"] = "date"
+    headers["DATE"] = "date"
     req = make_mocked_request("GET", "/", version=HttpVersion11)
     await resp._start(req)
-    assert resp.headers["CONTENT-LENGTH"] == "9"
+    assert headers["CONTENT-LENGTH"] == "9"
 
 
 def test_ctor_charset() -> None:
@@ -906,10 +905,11 @@ async def test_assign_nonbyteish_body() -> None:
     assert b"data" == resp.body
     assert 4 == resp.content_length
 
-    resp.headers["DATE"] = "date"
+    headers = resp.headers
+    headers["DATE"] = "date"
     req = make_mocked_request("GET", "/", version=HttpVersion11)
     await resp._start(req)
-    assert resp.headers["CONTENT-LENGTH"] == "4"
+    assert headers["CONTENT-LENGTH"] == "4"
     assert 4 == resp.content_length
 
 